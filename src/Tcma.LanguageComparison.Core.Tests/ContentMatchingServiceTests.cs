@@ -0,0 +1,69 @@
+using System.Collections.Generic;
+using System.Threading.Tasks;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using Tcma.LanguageComparison.Core.Models;
+using Tcma.LanguageComparison.Core.Services;
+
+namespace Tcma.LanguageComparison.Core.Tests
+{
+    [TestClass]
+    public class ContentMatchingServiceTests
+    {
+        private static List<ContentRow> CreateRows(string prefix, params float[][] vectors)
+        {
+            var rows = new List<ContentRow>();
+            for (int i = 0; i < vectors.Length; i++)
+            {
+                // Mirror GeminiEmbeddingService, which stores embeddings L2-normalized
+                GeminiEmbeddingService.NormalizeVectorInPlace(vectors[i]);
+                rows.Add(new ContentRow
+                {
+                    ContentId = $"{prefix}{i}",
+                    Content = $"{prefix} content {i}",
+                    OriginalIndex = i,
+                    EmbeddingVector = vectors[i]
+                });
+            }
+            return rows;
+        }
+
+        [TestMethod]
+        public async Task GenerateAlignedTargetFileAsync_ShouldPairRowsByHighestSimilarity()
+        {
+            var service = new ContentMatchingService(0.5);
+            var referenceRows = CreateRows("R",
+                new[] { 1f, 0f, 0f },
+                new[] { 0f, 1f, 0f },
+                new[] { 0f, 0f, 1f });
+            var targetRows = CreateRows("T",
+                new[] { 0f, 0f, 3f },
+                new[] { 2f, 0.1f, 0f },
+                new[] { 0f, 5f, 0f });
+
+            var result = await service.GenerateAlignedTargetFileAsync(referenceRows, targetRows);
+
+            Assert.AreEqual(3, result.MatchedRows);
+            Assert.AreEqual("T1", result.AlignedRows[0].TargetRow!.ContentId);
+            Assert.AreEqual("T2", result.AlignedRows[1].TargetRow!.ContentId);
+            Assert.AreEqual("T0", result.AlignedRows[2].TargetRow!.ContentId);
+            Assert.AreEqual(1.0, result.AlignedRows[2].SimilarityScore!.Value, 1e-6);
+        }
+
+        [TestMethod]
+        public async Task GenerateAlignedTargetFileAsync_ShouldLeaveRowsBelowThresholdMissing()
+        {
+            var service = new ContentMatchingService(0.9);
+            var referenceRows = CreateRows("R",
+                new[] { 1f, 0f },
+                new[] { 0f, 1f });
+            var targetRows = CreateRows("T",
+                new[] { 1f, 1f });
+
+            var result = await service.GenerateAlignedTargetFileAsync(referenceRows, targetRows);
+
+            Assert.AreEqual(0, result.MatchedRows);
+            Assert.AreEqual(2, result.MissingRows);
+            Assert.AreEqual(1, result.UnusedRows);
+        }
+    }
+}
@@ -0,0 +1,101 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Text;
+using System.Threading.Tasks;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using Tcma.LanguageComparison.Core.Models;
+using Tcma.LanguageComparison.Core.Services;
+
+namespace Tcma.LanguageComparison.Core.Tests
+{
+    [TestClass]
+    public class CsvReaderServiceTests
+    {
+        private string _csvFile = string.Empty;
+
+        [TestInitialize]
+        public void Setup()
+        {
+            _csvFile = Path.Combine(Path.GetTempPath(), $"content_rows_{Guid.NewGuid():N}.csv");
+        }
+
+        [TestCleanup]
+        public void Cleanup()
+        {
+            if (File.Exists(_csvFile))
+            {
+                File.Delete(_csvFile);
+            }
+        }
+
+        private async Task<OperationResult<List<ContentRow>>> ReadAsync(string csvContent)
+        {
+            await File.WriteAllTextAsync(_csvFile, csvContent, Encoding.UTF8);
+            return await new CsvReaderService().ReadContentRowsAsync(_csvFile);
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldReturnEmptyFileForHeaderOnlyFile()
+        {
+            var result = await ReadAsync("ContentId,Content\n");
+
+            Assert.IsFalse(result.IsSuccess);
+            Assert.AreEqual(CommonErrors.EmptyFile(_csvFile).TechnicalDetails, result.Error!.TechnicalDetails);
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldReturnInvalidCsvFormatWhenContentHeaderIsMissing()
+        {
+            var result = await ReadAsync("ContentId,Text\nID1,Hello\n");
+
+            Assert.IsFalse(result.IsSuccess);
+            Assert.AreEqual(CommonErrors.InvalidCsvFormat(_csvFile, "Missing 'ContentId' or 'Content' header").TechnicalDetails,
+                result.Error!.TechnicalDetails);
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldTrimFields()
+        {
+            var result = await ReadAsync("ContentId,Content\n  ID1  ,  Xin chào  \n");
+
+            Assert.IsTrue(result.IsSuccess);
+            Assert.AreEqual("ID1", result.Data![0].ContentId);
+            Assert.AreEqual("Xin chào", result.Data[0].Content);
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldSkipBlankRowsAndNumberRemainingRows()
+        {
+            var result = await ReadAsync("ContentId,Content\nID1,First\n\n,\nID2,Second\n  ,  \nID3,Third\n");
+
+            Assert.IsTrue(result.IsSuccess);
+            Assert.AreEqual(3, result.Data!.Count);
+            for (int i = 0; i < result.Data.Count; i++)
+            {
+                Assert.AreEqual($"ID{i + 1}", result.Data[i].ContentId);
+                Assert.AreEqual(i, result.Data[i].OriginalIndex);
+            }
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldReturnFileNotFoundForMissingFile()
+        {
+            var result = await new CsvReaderService().ReadContentRowsAsync(_csvFile);
+
+            Assert.IsFalse(result.IsSuccess);
+            Assert.AreEqual(CommonErrors.FileNotFound(_csvFile).TechnicalDetails, result.Error!.TechnicalDetails);
+        }
+
+        [TestMethod]
+        public async Task ReadContentRowsAsync_ShouldReturnFileNotFoundForMissingDirectory()
+        {
+            var missingPath = Path.Combine(Path.GetTempPath(), $"missing_{Guid.NewGuid():N}", "content.csv");
+
+            var result = await new CsvReaderService().ReadContentRowsAsync(missingPath);
+
+            Assert.IsFalse(result.IsSuccess);
+            Assert.AreEqual(CommonErrors.FileNotFound(missingPath).TechnicalDetails, result.Error!.TechnicalDetails);
+        }
+    }
+}
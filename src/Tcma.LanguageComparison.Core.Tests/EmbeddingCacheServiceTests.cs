@@ -0,0 +1,112 @@
+using System;
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using Tcma.LanguageComparison.Core.Services;
+
+namespace Tcma.LanguageComparison.Core.Tests
+{
+    [TestClass]
+    public class EmbeddingCacheServiceTests
+    {
+        private string _cacheFile = string.Empty;
+
+        [TestInitialize]
+        public void Setup()
+        {
+            _cacheFile = Path.Combine(Path.GetTempPath(), $"embedding_cache_{Guid.NewGuid():N}.bin");
+        }
+
+        [TestCleanup]
+        public void Cleanup()
+        {
+            if (File.Exists(_cacheFile))
+            {
+                File.Delete(_cacheFile);
+            }
+        }
+
+        [TestMethod]
+        public void ComputeKey_ShouldDependOnModelAndText()
+        {
+            var key = EmbeddingCacheService.ComputeKey("model-a", "Hello world");
+            Assert.AreEqual(key, EmbeddingCacheService.ComputeKey("model-a", "Hello world"));
+            Assert.AreNotEqual(key, EmbeddingCacheService.ComputeKey("model-b", "Hello world"));
+            Assert.AreNotEqual(key, EmbeddingCacheService.ComputeKey("model-a", "Hello world!"));
+        }
+
+        [TestMethod]
+        public async Task SaveAsync_ThenLoadAsync_ShouldRoundTripVectors()
+        {
+            var cache = new EmbeddingCacheService(_cacheFile);
+            cache.Set("model-a", "Xin chào", new[] { 0.1f, -0.2f, 0.3f });
+            cache.Set("model-a", "Tôi là AI", new[] { 1.0f, 0.0f });
+            Assert.IsTrue((await cache.SaveAsync()).IsSuccess);
+
+            var reloaded = new EmbeddingCacheService(_cacheFile);
+            var loadResult = await reloaded.LoadAsync();
+            Assert.IsTrue(loadResult.IsSuccess);
+            Assert.AreEqual(2, loadResult.Data);
+
+            Assert.IsTrue(reloaded.TryGet("model-a", "Xin chào", out var vector));
+            CollectionAssert.AreEqual(new[] { 0.1f, -0.2f, 0.3f }, vector);
+            Assert.IsFalse(reloaded.TryGet("model-b", "Xin chào", out _));
+        }
+
+        [TestMethod]
+        public async Task SaveAsync_ShouldSkipWriteWhenCacheIsUnchanged()
+        {
+            var cache = new EmbeddingCacheService(_cacheFile);
+            cache.Set("model-a", "Xin chào", new[] { 0.6f, 0.8f });
+            Assert.IsTrue((await cache.SaveAsync()).Data);
+
+            var reloaded = new EmbeddingCacheService(_cacheFile);
+            await reloaded.LoadAsync();
+            var lastWrite = File.GetLastWriteTimeUtc(_cacheFile);
+
+            var result = await reloaded.SaveAsync();
+            Assert.IsTrue(result.IsSuccess);
+            Assert.IsFalse(result.Data);
+            Assert.AreEqual(lastWrite, File.GetLastWriteTimeUtc(_cacheFile));
+        }
+
+        [TestMethod]
+        public async Task SaveAsync_ShouldPersistEntriesSetBeforeLoadAsync()
+        {
+            var cache = new EmbeddingCacheService(_cacheFile);
+            cache.Set("model-a", "Xin chào", new[] { 0.6f, 0.8f });
+            Assert.IsTrue((await cache.SaveAsync()).Data);
+
+            var reloaded = new EmbeddingCacheService(_cacheFile);
+            reloaded.Set("model-a", "Tôi là AI", new[] { 1.0f, 0.0f });
+            await reloaded.LoadAsync();
+
+            var result = await reloaded.SaveAsync();
+            Assert.IsTrue(result.IsSuccess);
+            Assert.IsTrue(result.Data);
+
+            var final = new EmbeddingCacheService(_cacheFile);
+            Assert.AreEqual(2, (await final.LoadAsync()).Data);
+            Assert.IsTrue(final.TryGet("model-a", "Tôi là AI", out _));
+        }
+
+        [TestMethod]
+        public async Task LoadAsync_ShouldSucceedWhenFileIsMissing()
+        {
+            var cache = new EmbeddingCacheService(_cacheFile);
+            var result = await cache.LoadAsync();
+            Assert.IsTrue(result.IsSuccess);
+            Assert.AreEqual(0, result.Data);
+            Assert.AreEqual(0, cache.Count);
+        }
+
+        [TestMethod]
+        public async Task LoadAsync_ShouldSucceedWhenDirectoryIsMissing()
+        {
+            var cache = new EmbeddingCacheService(Path.Combine(Path.GetTempPath(), $"missing_{Guid.NewGuid():N}", "cache.bin"));
+            var result = await cache.LoadAsync();
+            Assert.IsTrue(result.IsSuccess);
+            Assert.AreEqual(0, result.Data);
+        }
+    }
+}
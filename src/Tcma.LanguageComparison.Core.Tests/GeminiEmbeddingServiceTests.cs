@@ -0,0 +1,44 @@
+using System;
+using System.Collections.Generic;
+using System.IO;
+using System.Threading.Tasks;
+using Microsoft.VisualStudio.TestTools.UnitTesting;
+using Mscc.GenerativeAI;
+using Tcma.LanguageComparison.Core.Models;
+using Tcma.LanguageComparison.Core.Services;
+
+namespace Tcma.LanguageComparison.Core.Tests
+{
+    [TestClass]
+    public class GeminiEmbeddingServiceTests
+    {
+        [TestMethod]
+        public async Task GenerateEmbeddingsAsync_ShouldServeFullyCachedRowsWithoutApiCalls()
+        {
+            var cache = new EmbeddingCacheService(Path.Combine(Path.GetTempPath(), $"embedding_cache_{Guid.NewGuid():N}.bin"));
+            var rows = new List<ContentRow>
+            {
+                new() { ContentId = "1", Content = "Hello world", CleanContent = "Hello world", OriginalIndex = 0 },
+                new() { ContentId = "2", Content = "Good morning", CleanContent = "Good morning", OriginalIndex = 1 }
+            };
+            var cachedVectors = new[] { new[] { 0.6f, 0.8f }, new[] { 1.0f, 0.0f } };
+            for (int i = 0; i < rows.Count; i++)
+            {
+                cache.Set(Model.TextEmbedding004, rows[i].CleanContent, cachedVectors[i]);
+            }
+
+            // The dummy key would make every real request fail, so any API call shows up as a failed row
+            var service = new GeminiEmbeddingService("dummy-api-key", 50, cache);
+            var result = await service.GenerateEmbeddingsAsync(rows);
+
+            Assert.IsTrue(result.IsSuccess);
+            Assert.AreEqual(rows.Count, result.Data!.CachedRows);
+            Assert.AreEqual(rows.Count, result.Data.SuccessfulRows);
+            Assert.AreEqual(0, result.Data.FailedRows);
+            for (int i = 0; i < rows.Count; i++)
+            {
+                Assert.AreSame(cachedVectors[i], rows[i].EmbeddingVector);
+            }
+        }
+    }
+}
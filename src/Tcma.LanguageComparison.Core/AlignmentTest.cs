@@ -3,6 +3,7 @@ using System.IO;
 using System.Linq;
 using System.Threading.Tasks;
 using System.Collections.Generic;
+using System.Text;
 using Tcma.LanguageComparison.Core.Services;
 using Tcma.LanguageComparison.Core.Models;
 
@@ -15,6 +16,9 @@ namespace Tcma.LanguageComparison.Core
     {
         public static async Task RunAlignmentTestAsync(string geminiApiKey)
         {
+            // Embeddings reference chạy song song với bước dịch, nên phải được chờ trên mọi đường thoát
+            Task<OperationResult<EmbeddingProcessingStats>>? refEmbTask = null;
+            EmbeddingCacheService? embeddingCache = null;
             try
             {
                 Console.WriteLine("🧪 Starting Alignment Test");
@@ -24,17 +28,23 @@ namespace Tcma.LanguageComparison.Core
                 var refFile = "sample/NX Essentials Google Ads Page_20250529-EN.csv";
                 var targetFile = "sample/NX Essentials Google Ads Page_20250529-ZH.csv";
                 var outputFile = "test_output_aligned.csv";
+                var embeddingCacheFile = "test_embedding_cache.bin";
                 
                 // Services
                 var csvService = new CsvReaderService();
-                var geminiService = new GeminiEmbeddingService(geminiApiKey, 50);
+                embeddingCache = new EmbeddingCacheService(embeddingCacheFile);
+                var geminiService = new GeminiEmbeddingService(geminiApiKey, 50, embeddingCache);
                 var preprocessingService = new TextPreprocessingService();
                 var matchingService = new ContentMatchingService(0.35);
                 var translationService = new GeminiTranslationService(geminiApiKey);
                 
-                // Load files
-                Console.WriteLine("📂 Loading reference file (EN)...");
-                var refResult = await csvService.ReadContentRowsAsync(refFile);
+                // Load files (hai file độc lập nên đọc song song)
+                Console.WriteLine("📂 Loading reference file (EN) and target file (DE)...");
+                var refLoadTask = csvService.ReadContentRowsAsync(refFile);
+                var targetLoadTask = csvService.ReadContentRowsAsync(targetFile);
+                await Task.WhenAll(refLoadTask, targetLoadTask);
+                
+                var refResult = await refLoadTask;
                 if (!refResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Failed to load reference file: {refResult.Error?.UserMessage}");
@@ -43,8 +53,7 @@ namespace Tcma.LanguageComparison.Core
                 var referenceRows = refResult.Data!;
                 Console.WriteLine($"   Loaded {referenceRows.Count} reference rows");
                 
-                Console.WriteLine("📂 Loading target file (DE)...");
-                var targetResult = await csvService.ReadContentRowsAsync(targetFile);
+                var targetResult = await targetLoadTask;
                 if (!targetResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Failed to load target file: {targetResult.Error?.UserMessage}");
@@ -56,6 +65,29 @@ namespace Tcma.LanguageComparison.Core
                 // Lưu trữ nội dung gốc trước khi dịch
                 var originalTargetRows = targetRows.ToList();
                 
+                // Create reference ContentId set (analysis chỉ cần kiểm tra membership, không cần content)
+                var refContentIds = referenceRows.Select(r => r.ContentId).ToHashSet(StringComparer.Ordinal);
+                
+                // Embeddings từ các lần chạy trước (cùng model + nội dung) được lấy lại từ cache
+                var cacheLoadResult = await embeddingCache.LoadAsync();
+                if (cacheLoadResult.IsSuccess)
+                {
+                    Console.WriteLine($"🗄️ Loaded {cacheLoadResult.Data} cached embeddings from {embeddingCacheFile}");
+                }
+                else
+                {
+                    Console.WriteLine($"⚠️ Embedding cache ignored: {cacheLoadResult.Error?.UserMessage}");
+                }
+                
+                // Reference không phụ thuộc vào bản dịch: preprocess và tạo embeddings song song với bước dịch
+                Console.WriteLine("\n🔧 Preprocessing reference content...");
+                preprocessingService.ProcessContentRows(referenceRows);
+                
+                Console.WriteLine("🧠 Generating embeddings for reference (in parallel with translation)...");
+                // Stream progress as batches complete so failures show up immediately, not after the whole run
+                var refEmbProgress = new Progress<string>(msg => Console.WriteLine($"[Embed Ref] {msg}"));
+                refEmbTask = geminiService.GenerateEmbeddingsAsync(referenceRows, refEmbProgress);
+                
                 // Dịch targetRows sang tiếng Anh
                 Console.WriteLine("🌐 Translating target content to English using Gemini Flash...");
                 var translationProgress = new Progress<string>(msg => Console.WriteLine($"[Translate] {msg}"));
@@ -77,30 +109,30 @@ namespace Tcma.LanguageComparison.Core
                 }
                 Console.WriteLine("🌐 Translation completed. Proceeding to preprocessing and embedding...");
                 
-                // Create reference ContentId map
-                var refContentMap = referenceRows.ToDictionary(r => r.ContentId, r => r.Content);
-                
                 // Preprocessing
-                Console.WriteLine("\n🔧 Preprocessing content...");
-                preprocessingService.ProcessContentRows(referenceRows);
+                Console.WriteLine("\n🔧 Preprocessing target content...");
                 preprocessingService.ProcessContentRows(targetRows);
                 
-                // Generate embeddings
-                Console.WriteLine("🧠 Generating embeddings for reference...");
-                var refEmbResult = await geminiService.GenerateEmbeddingsAsync(referenceRows, null);
+                // Generate target embeddings while reference embeddings may still be in flight
+                Console.WriteLine("🧠 Generating embeddings for target...");
+                var targetEmbProgress = new Progress<string>(msg => Console.WriteLine($"[Embed Target] {msg}"));
+                var targetEmbTask = geminiService.GenerateEmbeddingsAsync(targetRows, targetEmbProgress);
+                await Task.WhenAll(refEmbTask, targetEmbTask);
+                
+                var refEmbResult = await refEmbTask;
                 if (!refEmbResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Failed to generate reference embeddings: {refEmbResult.Error?.UserMessage}");
                     return;
                 }
                 
-                Console.WriteLine("🧠 Generating embeddings for target...");
-                var targetEmbResult = await geminiService.GenerateEmbeddingsAsync(targetRows, null);
+                var targetEmbResult = await targetEmbTask;
                 if (!targetEmbResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Failed to generate target embeddings: {targetEmbResult.Error?.UserMessage}");
                     return;
                 }
+                Console.WriteLine($"   Cache hits: {refEmbResult.Data!.CachedRows} reference, {targetEmbResult.Data!.CachedRows} target");
                 
                 // Generate aligned display data
                 Console.WriteLine("\n⚡ Running alignment algorithm...");
@@ -118,7 +150,7 @@ namespace Tcma.LanguageComparison.Core
                 
                 // Analyze results
                 Console.WriteLine("\n📊 Analyzing alignment results...");
-                await AnalyzeAlignmentResults(refContentMap, outputFile, alignedData, referenceRows);
+                await AnalyzeAlignmentResults(refContentIds, outputFile, alignedData, referenceRows);
                 
             }
             catch (Exception ex)
@@ -126,10 +158,39 @@ namespace Tcma.LanguageComparison.Core
                 Console.WriteLine($"💥 Test failed with exception: {ex.Message}");
                 Console.WriteLine($"Stack trace: {ex.StackTrace}");
             }
+            finally
+            {
+                // Không để request Gemini của reference chạy ngầm khi test kết thúc sớm (dịch lỗi, exception...)
+                if (refEmbTask != null)
+                {
+                    if (!refEmbTask.IsCompleted)
+                    {
+                        Console.WriteLine("⏳ Waiting for in-flight reference embeddings to finish...");
+                    }
+                    try
+                    {
+                        await refEmbTask;
+                    }
+                    catch (Exception ex)
+                    {
+                        Console.WriteLine($"⚠️ Reference embeddings failed: {ex.Message}");
+                    }
+                }
+                
+                // Lưu cache cả khi test dừng giữa chừng: các vector đã gọi API thành công không bị mất
+                if (embeddingCache != null)
+                {
+                    var cacheSaveResult = await embeddingCache.SaveAsync();
+                    if (!cacheSaveResult.IsSuccess)
+                    {
+                        Console.WriteLine($"⚠️ Failed to save embedding cache: {cacheSaveResult.Error?.UserMessage}");
+                    }
+                }
+            }
         }
         
         private static async Task AnalyzeAlignmentResults(
-            Dictionary<string, string> refContentMap, 
+            HashSet<string> refContentIds, 
             string outputFile,
             List<AlignedDisplayRow> alignedData,
             List<ContentRow> referenceRows)
@@ -139,71 +200,85 @@ namespace Tcma.LanguageComparison.Core
                 // Analyze in-memory aligned data first
                 Console.WriteLine("🔍 Analyzing in-memory alignment data:");
                 
-                var matchedRows = alignedData.Where(r => r.Status == "Matched").ToList();
-                var missingRows = alignedData.Where(r => r.Status == "Missing").ToList();
-                var unmatchedTargetRows = alignedData.Where(r => r.Status == "Unmatched Target").ToList();
+                // Partition rows by status in a single pass instead of one filtered scan per status
+                var matchedRows = new List<AlignedDisplayRow>(alignedData.Count);
+                var missingRows = new List<AlignedDisplayRow>();
+                var unmatchedTargetRows = new List<AlignedDisplayRow>();
+                foreach (var row in alignedData)
+                {
+                    switch (row.Status)
+                    {
+                        case "Matched":
+                            matchedRows.Add(row);
+                            break;
+                        case "Missing":
+                            missingRows.Add(row);
+                            break;
+                        case "Unmatched Target":
+                            unmatchedTargetRows.Add(row);
+                            break;
+                    }
+                }
                 
                 Console.WriteLine($"   ✅ Matched rows: {matchedRows.Count}");
                 Console.WriteLine($"   ❌ Missing rows: {missingRows.Count}");
                 Console.WriteLine($"   🔄 Unmatched target rows: {unmatchedTargetRows.Count}");
                 
-                // Check ContentId consistency
-                var contentIdMatches = 0;
-                var contentIdMismatches = new List<string>();
+                // Check ContentId consistency once per matched row; the report and examples below reuse the result
+                var isConsistent = new bool[matchedRows.Count];
+                var mismatchIndexes = new List<int>();
                 
-                foreach (var row in matchedRows)
+                for (int i = 0; i < matchedRows.Count; i++)
                 {
-                    var targetContentId = row.TargetContentId;
+                    var targetContentId = matchedRows[i].TargetContentId;
                     
-                    if (!string.IsNullOrEmpty(targetContentId) && refContentMap.ContainsKey(targetContentId))
+                    if (!string.IsNullOrEmpty(targetContentId) && refContentIds.Contains(targetContentId))
                     {
-                        contentIdMatches++;
+                        isConsistent[i] = true;
                     }
                     else
                     {
-                        contentIdMismatches.Add($"Target ContentId '{targetContentId}' not found in reference");
+                        mismatchIndexes.Add(i);
                     }
                 }
                 
+                var contentIdMatches = matchedRows.Count - mismatchIndexes.Count;
                 var accuracy = matchedRows.Count > 0 ? (double)contentIdMatches / matchedRows.Count * 100 : 0;
                 
                 Console.WriteLine($"\n📈 ContentId Consistency Analysis:");
                 Console.WriteLine($"   ✅ ContentId matches: {contentIdMatches}/{matchedRows.Count}");
                 Console.WriteLine($"   📊 Accuracy: {accuracy:F2}%");
                 
-                if (contentIdMismatches.Any())
+                if (mismatchIndexes.Count > 0)
                 {
-                    Console.WriteLine($"   ❌ Found {contentIdMismatches.Count} ContentId mismatches:");
-                    foreach (var mismatch in contentIdMismatches.Take(5))
+                    Console.WriteLine($"   ❌ Found {mismatchIndexes.Count} ContentId mismatches:");
+                    var mismatchLines = new StringBuilder();
+                    foreach (var i in mismatchIndexes.Take(5))
                     {
-                        Console.WriteLine($"      • {mismatch}");
+                        mismatchLines.AppendLine($"      • Target ContentId '{matchedRows[i].TargetContentId}' not found in reference");
                     }
-                    if (contentIdMismatches.Count > 5)
+                    if (mismatchIndexes.Count > 5)
                     {
-                        Console.WriteLine($"      • ... and {contentIdMismatches.Count - 5} more");
+                        mismatchLines.AppendLine($"      • ... and {mismatchIndexes.Count - 5} more");
                     }
+                    Console.Write(mismatchLines.ToString());
 
-                    // Ghi báo cáo mismatch ra file CSV
+                    // Ghi báo cáo mismatch ra file CSV (chỉ duyệt các dòng mismatch)
                     var mismatchFile = "test_output_mismatch.csv";
                     using (var writer = new StreamWriter(mismatchFile, false, System.Text.Encoding.UTF8))
                     {
                         writer.WriteLine("Index,RefContentId,RefContent,TargetContentId,TargetContent,SimilarityScore,Status");
-                        int idx = 0;
-                        foreach (var row in matchedRows)
+                        foreach (var idx in mismatchIndexes)
                         {
-                            var targetContentId = row.TargetContentId;
-                            if (string.IsNullOrEmpty(targetContentId) || !refContentMap.ContainsKey(targetContentId))
+                            var row = matchedRows[idx];
+                            string refContentId = string.Empty;
+                            if (row.RefLineNumber != null && row.RefLineNumber.Value > 0 && row.RefLineNumber.Value <= referenceRows.Count)
                             {
-                                string refContentId = string.Empty;
-                                if (row.RefLineNumber != null && row.RefLineNumber.Value > 0 && row.RefLineNumber.Value <= referenceRows.Count)
-                                {
-                                    refContentId = referenceRows[row.RefLineNumber.Value - 1].ContentId;
-                                }
-                                var refContent = row.RefContent?.Replace("\"", "''").Replace("\n", " ") ?? "";
-                                var targetContent = row.TargetContent?.Replace("\"", "''").Replace("\n", " ") ?? "";
-                                writer.WriteLine($"{idx},\"{refContentId}\",\"{refContent}\",\"{targetContentId}\",\"{targetContent}\",{row.SimilarityScore:F3},{row.Status}");
+                                refContentId = referenceRows[row.RefLineNumber.Value - 1].ContentId;
                             }
-                            idx++;
+                            var refContent = row.RefContent?.Replace("\"", "''").Replace("\n", " ") ?? "";
+                            var targetContent = row.TargetContent?.Replace("\"", "''").Replace("\n", " ") ?? "";
+                            writer.WriteLine($"{idx},\"{refContentId}\",\"{refContent}\",\"{row.TargetContentId}\",\"{targetContent}\",{row.SimilarityScore:F3},{row.Status}");
                         }
                     }
                     Console.WriteLine($"   📄 Exported mismatch report to {mismatchFile}");
@@ -212,18 +287,21 @@ namespace Tcma.LanguageComparison.Core
                 // Show some examples of successful matches
                 Console.WriteLine($"\n🎯 Examples of successful matches:");
                 var successfulMatches = matchedRows
-                    .Where(r => !string.IsNullOrEmpty(r.TargetContentId) && refContentMap.ContainsKey(r.TargetContentId))
+                    .Where((r, i) => isConsistent[i])
                     .Take(3)
                     .ToList();
                     
+                // Gom output vào một buffer và ghi một lần; cắt chuỗi bằng span để không tạo substring tạm
+                var exampleLines = new StringBuilder();
                 foreach (var match in successfulMatches)
                 {
-                    Console.WriteLine($"   ✅ ContentId: {match.TargetContentId}");
-                    Console.WriteLine($"      Ref:    {match.RefContent.Substring(0, Math.Min(50, match.RefContent.Length))}...");
-                    Console.WriteLine($"      Target: {match.TargetContent.Substring(0, Math.Min(50, match.TargetContent.Length))}...");
-                    Console.WriteLine($"      Score:  {match.SimilarityScore:F3}");
-                    Console.WriteLine();
+                    exampleLines.AppendLine($"   ✅ ContentId: {match.TargetContentId}");
+                    exampleLines.AppendLine($"      Ref:    {match.RefContent.AsSpan(0, Math.Min(50, match.RefContent.Length))}...");
+                    exampleLines.AppendLine($"      Target: {match.TargetContent.AsSpan(0, Math.Min(50, match.TargetContent.Length))}...");
+                    exampleLines.AppendLine($"      Score:  {match.SimilarityScore:F3}");
+                    exampleLines.AppendLine();
                 }
+                Console.Write(exampleLines.ToString());
                 
                 // Summary
                 Console.WriteLine("🏁 Test Summary:");
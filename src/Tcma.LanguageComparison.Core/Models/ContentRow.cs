@@ -26,7 +26,7 @@ namespace Tcma.LanguageComparison.Core.Models
         public string CleanContent { get; set; } = string.Empty;
 
         /// <summary>
-        /// Generated embedding vector for this content
+        /// Generated embedding vector for this content (L2-normalized, so cosine similarity is a dot product)
         /// </summary>
         public float[]? EmbeddingVector { get; set; }
     }
@@ -87,7 +87,11 @@ namespace Tcma.LanguageComparison.Core
                 Console.WriteLine($"English file: {englishFile}");
                 Console.WriteLine($"Korean file: {koreanFile}");
 
-                var refResult = await csvService.ReadContentRowsAsync(englishFile);
+                var refReadTask = csvService.ReadContentRowsAsync(englishFile);
+                var targetReadTask = csvService.ReadContentRowsAsync(koreanFile);
+                await Task.WhenAll(refReadTask, targetReadTask);
+
+                var refResult = await refReadTask;
                 if (!refResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Lỗi đọc file reference: {refResult.Error?.UserMessage}");
@@ -95,7 +99,7 @@ namespace Tcma.LanguageComparison.Core
                     return;
                 }
 
-                var targetResult = await csvService.ReadContentRowsAsync(koreanFile);
+                var targetResult = await targetReadTask;
                 if (!targetResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Lỗi đọc file target: {targetResult.Error?.UserMessage}");
@@ -124,17 +128,23 @@ namespace Tcma.LanguageComparison.Core
                 Console.WriteLine($"✓ Xử lý {limitedRef.Count} reference và {limitedTarget.Count} target rows" +
                                  (config.LanguageComparison.DemoRowLimit > 0 ? " (giới hạn cho demo)" : ""));
 
-                // Generate embeddings
-                Console.WriteLine("\nTạo embeddings cho nội dung reference...");
-                var refEmbeddingResult = await embeddingService.GenerateEmbeddingsAsync(limitedRef, progress);
+                // Generate embeddings (reference và target chạy song song để overlap network latency)
+                Console.WriteLine("\nTạo embeddings cho nội dung reference và target...");
+                // Mỗi lần chạy có progress riêng (có prefix) để log của hai luồng song song không lẫn vào nhau
+                var refEmbeddingProgress = new Progress<string>(message => Console.WriteLine($"[Embed Ref] {message}"));
+                var targetEmbeddingProgress = new Progress<string>(message => Console.WriteLine($"[Embed Target] {message}"));
+                var refEmbeddingTask = embeddingService.GenerateEmbeddingsAsync(limitedRef, refEmbeddingProgress);
+                var targetEmbeddingTask = embeddingService.GenerateEmbeddingsAsync(limitedTarget, targetEmbeddingProgress);
+                await Task.WhenAll(refEmbeddingTask, targetEmbeddingTask);
+
+                var refEmbeddingResult = await refEmbeddingTask;
                 if (!refEmbeddingResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Lỗi tạo embeddings cho reference: {refEmbeddingResult.Error?.UserMessage}");
                     return;
                 }
 
-                Console.WriteLine("\nTạo embeddings cho nội dung target...");
-                var targetEmbeddingResult = await embeddingService.GenerateEmbeddingsAsync(limitedTarget, progress);
+                var targetEmbeddingResult = await targetEmbeddingTask;
                 if (!targetEmbeddingResult.IsSuccess)
                 {
                     Console.WriteLine($"❌ Lỗi tạo embeddings cho target: {targetEmbeddingResult.Error?.UserMessage}");
@@ -260,8 +270,13 @@ namespace Tcma.LanguageComparison.Core
             }
 
             Console.WriteLine("Tạo embeddings cho demo content...");
-            var refResult = await embeddingService.GenerateEmbeddingsAsync(testRef, progress);
-            var targetResult = await embeddingService.GenerateEmbeddingsAsync(testTarget, progress);
+            var refTask = embeddingService.GenerateEmbeddingsAsync(testRef,
+                new Progress<string>(message => Console.WriteLine($"[Embed Ref] {message}")));
+            var targetTask = embeddingService.GenerateEmbeddingsAsync(testTarget,
+                new Progress<string>(message => Console.WriteLine($"[Embed Target] {message}")));
+            await Task.WhenAll(refTask, targetTask);
+            var refResult = await refTask;
+            var targetResult = await targetTask;
 
             if (refResult.IsSuccess && targetResult.IsSuccess)
             {
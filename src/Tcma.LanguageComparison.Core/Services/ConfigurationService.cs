@@ -8,6 +8,12 @@ namespace Tcma.LanguageComparison.Core.Services
     /// </summary>
     public class ConfigurationService
     {
+        // Single shared instance so the serializer metadata is built once, not on every save
+        private static readonly System.Text.Json.JsonSerializerOptions SerializerOptions = new()
+        {
+            WriteIndented = true
+        };
+
         private readonly AppConfiguration _config;
 
         /// <summary>
@@ -100,18 +106,22 @@ namespace Tcma.LanguageComparison.Core.Services
         /// </summary>
         public async Task SaveConfigurationAsync()
         {
+            const string configFilePath = "appsettings.json";
+            var tempFilePath = configFilePath + ".tmp";
             try
             {
-                var jsonString = System.Text.Json.JsonSerializer.Serialize(_config, new System.Text.Json.JsonSerializerOptions
+                // Serialize UTF-8 straight into a temp file, then swap it in: a failed serialization
+                // never leaves appsettings.json truncated
+                await using (var stream = File.Create(tempFilePath))
                 {
-                    WriteIndented = true
-                });
-
-                await File.WriteAllTextAsync("appsettings.json", jsonString);
+                    await System.Text.Json.JsonSerializer.SerializeAsync(stream, _config, SerializerOptions);
+                }
+                File.Move(tempFilePath, configFilePath, overwrite: true);
                 Console.WriteLine("✓ Configuration saved to appsettings.json");
             }
             catch (Exception ex)
             {
+                File.Delete(tempFilePath);
                 Console.WriteLine($"❌ Failed to save configuration: {ex.Message}");
             }
         }
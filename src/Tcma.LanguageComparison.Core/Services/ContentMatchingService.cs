@@ -1,7 +1,9 @@
 using System;
 using System.Collections.Concurrent;
 using System.Collections.Generic;
+using System.Diagnostics;
 using System.Linq;
+using System.Numerics.Tensors;
 using System.Threading.Tasks;
 using Tcma.LanguageComparison.Core.Models;
 using Tcma.LanguageComparison.Core.Services;
@@ -34,6 +36,7 @@ namespace Tcma.LanguageComparison.Core.Services
 
         /// <summary>
         /// Calculates cosine similarity with caching to avoid redundant calculations
+        /// (embedding vectors are stored L2-normalized, so this is a plain dot product)
         /// </summary>
         private double GetCachedSimilarity(ContentRow row1, ContentRow row2)
         {
@@ -46,7 +49,47 @@ namespace Tcma.LanguageComparison.Core.Services
                 : $"{row2.ContentId}|{row1.ContentId}";
 
             return _similarityCache.GetOrAdd(key, _ => 
-                GeminiEmbeddingService.CalculateCosineSimilarity(row1.EmbeddingVector, row2.EmbeddingVector));
+                GeminiEmbeddingService.CalculateDotProduct(row1.EmbeddingVector, row2.EmbeddingVector));
+        }
+
+        /// <summary>
+        /// Tính similarity matrix cho tất cả cặp ref × target: embedding đã được chuẩn hóa L2 khi tạo,
+        /// nên mỗi ô chỉ còn là một dot product (không sqrt/chia, không tạo cache key cho từng cặp)
+        /// </summary>
+        private static double[,] BuildSimilarityMatrix(List<ContentRow> refRows, List<ContentRow> targetRows)
+        {
+            var refVectors = refRows.Select(r => r.EmbeddingVector!).ToArray();
+            var targetVectors = targetRows.Select(t => t.EmbeddingVector!).ToArray();
+
+            var matrix = new double[refVectors.Length, targetVectors.Length];
+            for (int i = 0; i < refVectors.Length; i++)
+            {
+                var refVector = refVectors[i];
+                for (int j = 0; j < targetVectors.Length; j++)
+                {
+                    matrix[i, j] = GeminiEmbeddingService.CalculateDotProduct(refVector, targetVectors[j]);
+                }
+            }
+
+            return matrix;
+        }
+
+        /// <summary>
+        /// Debug check cho điều kiện tiên quyết: score là dot product nên vector chưa chuẩn hóa sẽ cho kết quả sai
+        /// (vector 0 được chấp nhận vì NormalizeVectorInPlace giữ nguyên chúng)
+        /// </summary>
+        [Conditional("DEBUG")]
+        private static void AssertEmbeddingsNormalized(List<ContentRow>? referenceRows, List<ContentRow>? targetRows)
+        {
+            foreach (var row in (referenceRows ?? Enumerable.Empty<ContentRow>()).Concat(targetRows ?? Enumerable.Empty<ContentRow>()))
+            {
+                if (row.EmbeddingVector == null)
+                    continue;
+
+                var norm = TensorPrimitives.Norm((ReadOnlySpan<float>)row.EmbeddingVector);
+                Debug.Assert(norm == 0f || Math.Abs(norm - 1f) < 1e-3f,
+                    $"Embedding of ContentId {row.ContentId} is not L2-normalized (norm = {norm})");
+            }
         }
 
         /// <summary>
@@ -59,6 +102,7 @@ namespace Tcma.LanguageComparison.Core.Services
 
         /// <summary>
         /// Finds matches between reference and target content rows
+        /// (embedding vectors must be L2-normalized, as produced by GeminiEmbeddingService)
         /// </summary>
         /// <param name="referenceRows">Reference language content (e.g., English)</param>
         /// <param name="targetRows">Target language content (e.g., Korean)</param>
@@ -73,6 +117,7 @@ namespace Tcma.LanguageComparison.Core.Services
             {
                 var refList = referenceRows?.ToList();
                 var targetList = targetRows?.ToList();
+                AssertEmbeddingsNormalized(refList, targetList);
 
                 if (refList == null || refList.Count == 0)
                 {
@@ -188,6 +233,7 @@ namespace Tcma.LanguageComparison.Core.Services
 
         /// <summary>
         /// Generates line-by-line report without reordering
+        /// (embedding vectors must be L2-normalized, as produced by GeminiEmbeddingService)
         /// </summary>
         /// <param name="referenceRows">Reference content rows</param>
         /// <param name="targetRows">Target content rows</param>
@@ -202,6 +248,7 @@ namespace Tcma.LanguageComparison.Core.Services
             {
                 var refList = referenceRows?.ToList();
                 var targetList = targetRows?.ToList();
+                AssertEmbeddingsNormalized(refList, targetList);
 
                 if (refList == null || refList.Count == 0)
                 {
@@ -323,6 +370,7 @@ namespace Tcma.LanguageComparison.Core.Services
         /// <summary>
         /// Tạo danh sách target đã align với reference (có dòng trống cho dòng thiếu)
         /// Sử dụng optimal bipartite matching thay vì greedy để đảm bảo alignment tối ưu
+        /// (embedding vectors phải đã chuẩn hóa L2 như GeminiEmbeddingService tạo ra, vì score là dot product)
         /// </summary>
         public async Task<AlignedTargetResult> GenerateAlignedTargetFileAsync(
             IEnumerable<ContentRow> referenceRows,
@@ -332,20 +380,14 @@ namespace Tcma.LanguageComparison.Core.Services
             var refList = referenceRows?.ToList() ?? new List<ContentRow>();
             var targetList = targetRows?.ToList() ?? new List<ContentRow>();
             var alignedRows = new List<AlignedTargetRow>();
+            AssertEmbeddingsNormalized(refList, targetList);
 
             // Lấy các dòng có embedding
             var refWithEmbeddings = refList.Where(r => r.EmbeddingVector != null).ToList();
             var targetWithEmbeddings = targetList.Where(t => t.EmbeddingVector != null).ToList();
 
             // Tạo similarity matrix
-            var similarityMatrix = new double[refWithEmbeddings.Count, targetWithEmbeddings.Count];
-            for (int i = 0; i < refWithEmbeddings.Count; i++)
-            {
-                for (int j = 0; j < targetWithEmbeddings.Count; j++)
-                {
-                    similarityMatrix[i, j] = GetCachedSimilarity(refWithEmbeddings[i], targetWithEmbeddings[j]);
-                }
-            }
+            var similarityMatrix = BuildSimilarityMatrix(refWithEmbeddings, targetWithEmbeddings);
 
             // Tìm optimal matching bằng Hungarian-like greedy approach (simplified)
             // Tạo map từ ref index → target match
@@ -378,17 +420,24 @@ namespace Tcma.LanguageComparison.Core.Services
                 }
             }
 
-            // Tạo aligned rows theo thứ tự reference
+            // Map OriginalIndex → index trong danh sách có embedding (thay cho FindIndex tuyến tính ở mỗi dòng)
+            var refEmbeddingIndexes = new Dictionary<int, int>(refWithEmbeddings.Count);
+            for (int k = 0; k < refWithEmbeddings.Count; k++)
+            {
+                refEmbeddingIndexes.TryAdd(refWithEmbeddings[k].OriginalIndex, k);
+            }
+
+            // Tạo aligned rows theo thứ tự reference, đếm số dòng matched ngay trong vòng lặp
+            var matchedCount = 0;
             for (int i = 0; i < refList.Count; i++)
             {
                 var refRow = refList[i];
                 
-                // Tìm index của ref row này trong danh sách có embedding bằng OriginalIndex
-                var refEmbeddingIdx = refWithEmbeddings.FindIndex(r => r.OriginalIndex == refRow.OriginalIndex);
-                
-                if (refEmbeddingIdx >= 0 && refToTargetMap.ContainsKey(refEmbeddingIdx))
+                if (refEmbeddingIndexes.TryGetValue(refRow.OriginalIndex, out var refEmbeddingIdx) &&
+                    refToTargetMap.TryGetValue(refEmbeddingIdx, out var match))
                 {
-                    var (targetRow, score) = refToTargetMap[refEmbeddingIdx];
+                    var (targetRow, score) = match;
+                    matchedCount++;
                     alignedRows.Add(new AlignedTargetRow
                     {
                         ReferenceIndex = i,
@@ -417,8 +466,8 @@ namespace Tcma.LanguageComparison.Core.Services
                 AlignedRows = alignedRows,
                 UnusedTargetRows = unusedTargetRows,
                 TotalReferenceRows = refList.Count,
-                MatchedRows = alignedRows.Count(r => r.HasMatch),
-                MissingRows = alignedRows.Count(r => !r.HasMatch),
+                MatchedRows = matchedCount,
+                MissingRows = alignedRows.Count - matchedCount,
                 UnusedRows = unusedTargetRows.Count
             };
         }
@@ -11,6 +11,8 @@ namespace Tcma.LanguageComparison.Core.Services
     /// </summary>
     public class CsvReaderService
     {
+        private const int ReadBufferSize = 64 * 1024;
+
         /// <summary>
         /// Reads content rows from a CSV file
         /// </summary>
@@ -26,12 +28,6 @@ namespace Tcma.LanguageComparison.Core.Services
                         CommonErrors.InvalidFilePath(filePath ?? "null"));
                 }
 
-                if (!File.Exists(filePath))
-                {
-                    return OperationResult<List<ContentRow>>.Failure(
-                        CommonErrors.FileNotFound(filePath));
-                }
-
                 // Validate file extension
                 var extension = Path.GetExtension(filePath).ToLower();
                 if (extension != ".csv")
@@ -46,24 +42,48 @@ namespace Tcma.LanguageComparison.Core.Services
                     });
                 }
 
-                using var reader = new StreamReader(filePath, Encoding.UTF8);
+                // Open directly and map a missing file from the exception (no separate exists check).
+                // SequentialScan lets the OS read ahead; the larger buffer cuts the number of read calls
+                using var stream = new FileStream(filePath, FileMode.Open, FileAccess.Read, FileShare.Read,
+                    ReadBufferSize, FileOptions.SequentialScan | FileOptions.Asynchronous);
+                using var reader = new StreamReader(stream, Encoding.UTF8);
                 using var csv = new CsvReader(reader, GetCsvConfiguration());
 
                 var records = new List<ContentRow>();
                 var index = 0;
 
-                await foreach (var record in csv.GetRecordsAsync<CsvRowDto>())
+                if (!await csv.ReadAsync())
+                {
+                    return OperationResult<List<ContentRow>>.Failure(
+                        CommonErrors.EmptyFile(filePath));
+                }
+
+                // Resolve column positions once from the header and read raw fields by index,
+                // instead of binding every row into a DTO through CsvHelper's record mapper
+                csv.ReadHeader();
+                var contentIdIndex = csv.GetFieldIndex(nameof(CsvRowDto.ContentId), isTryGet: true);
+                var contentIndex = csv.GetFieldIndex(nameof(CsvRowDto.Content), isTryGet: true);
+                if (contentIdIndex < 0 || contentIndex < 0)
+                {
+                    return OperationResult<List<ContentRow>>.Failure(
+                        CommonErrors.InvalidCsvFormat(filePath, "Missing 'ContentId' or 'Content' header"));
+                }
+
+                while (await csv.ReadAsync())
                 {
+                    var contentId = csv.GetField(contentIdIndex);
+                    var content = csv.GetField(contentIndex);
+
                     // Validate required fields
-                    if (string.IsNullOrEmpty(record.ContentId) && string.IsNullOrEmpty(record.Content))
+                    if (string.IsNullOrEmpty(contentId) && string.IsNullOrEmpty(content))
                     {
                         continue; // Skip empty rows
                     }
 
                     records.Add(new ContentRow
                     {
-                        ContentId = record.ContentId ?? string.Empty,
-                        Content = record.Content ?? string.Empty,
+                        ContentId = contentId ?? string.Empty,
+                        Content = content ?? string.Empty,
                         OriginalIndex = index++
                     });
                 }
@@ -84,6 +104,11 @@ namespace Tcma.LanguageComparison.Core.Services
 
                 return OperationResult<List<ContentRow>>.Success(records);
             }
+            catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+            {
+                return OperationResult<List<ContentRow>>.Failure(
+                    CommonErrors.FileNotFound(filePath));
+            }
             catch (UnauthorizedAccessException ex)
             {
                 return OperationResult<List<ContentRow>>.Failure(new ErrorInfo
@@ -146,9 +171,9 @@ namespace Tcma.LanguageComparison.Core.Services
                     });
                 }
 
-                // Ensure directory exists
+                // Ensure directory exists (CreateDirectory is a no-op when it already does)
                 var directory = Path.GetDirectoryName(filePath);
-                if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
+                if (!string.IsNullOrEmpty(directory))
                 {
                     Directory.CreateDirectory(directory);
                 }
@@ -232,9 +257,9 @@ namespace Tcma.LanguageComparison.Core.Services
                     });
                 }
 
-                // Ensure directory exists
+                // Ensure directory exists (CreateDirectory is a no-op when it already does)
                 var directory = Path.GetDirectoryName(filePath);
-                if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
+                if (!string.IsNullOrEmpty(directory))
                 {
                     Directory.CreateDirectory(directory);
                 }
@@ -311,9 +336,9 @@ namespace Tcma.LanguageComparison.Core.Services
                     });
                 }
 
-                // Ensure directory exists
+                // Ensure directory exists (CreateDirectory is a no-op when it already does)
                 var directory = Path.GetDirectoryName(filePath);
-                if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
+                if (!string.IsNullOrEmpty(directory))
                 {
                     Directory.CreateDirectory(directory);
                 }
@@ -0,0 +1,182 @@
+using System.Collections.Concurrent;
+using System.Runtime.InteropServices;
+using System.Security.Cryptography;
+using System.Text;
+using Tcma.LanguageComparison.Core.Models;
+
+namespace Tcma.LanguageComparison.Core.Services
+{
+    /// <summary>
+    /// Content-addressed cache for embedding vectors, persisted to a local binary file
+    /// so repeated runs over the same content skip the Gemini API entirely
+    /// </summary>
+    public class EmbeddingCacheService
+    {
+        private const int FileFormatVersion = 2; // v2: vectors are stored L2-normalized
+        private readonly string _cacheFilePath;
+        private readonly ConcurrentDictionary<string, float[]> _entries;
+        private volatile bool _hasUnsavedChanges;
+
+        /// <summary>
+        /// Initializes the embedding cache
+        /// </summary>
+        /// <param name="cacheFilePath">Path of the cache file used by LoadAsync/SaveAsync</param>
+        public EmbeddingCacheService(string cacheFilePath)
+        {
+            if (string.IsNullOrWhiteSpace(cacheFilePath))
+            {
+                throw new ArgumentException("Cache file path cannot be null or empty", nameof(cacheFilePath));
+            }
+
+            _cacheFilePath = cacheFilePath;
+            _entries = new ConcurrentDictionary<string, float[]>();
+        }
+
+        /// <summary>
+        /// Number of cached embedding vectors
+        /// </summary>
+        public int Count => _entries.Count;
+
+        /// <summary>
+        /// Computes the cache key (SHA-256 of model name and clean text)
+        /// </summary>
+        public static string ComputeKey(string model, string text)
+        {
+            var hash = SHA256.HashData(Encoding.UTF8.GetBytes($"{model}\0{text}"));
+            return Convert.ToHexString(hash);
+        }
+
+        /// <summary>
+        /// Looks up a cached embedding vector for the given model and text
+        /// </summary>
+        public bool TryGet(string model, string text, out float[]? vector)
+        {
+            return _entries.TryGetValue(ComputeKey(model, text), out vector);
+        }
+
+        /// <summary>
+        /// Stores an embedding vector for the given model and text
+        /// </summary>
+        public void Set(string model, string text, float[] vector)
+        {
+            var key = ComputeKey(model, text);
+            if (_entries.TryGetValue(key, out var existing) && existing.AsSpan().SequenceEqual(vector))
+            {
+                return; // Same vector already cached, nothing new to persist
+            }
+
+            _entries[key] = vector;
+            _hasUnsavedChanges = true;
+        }
+
+        /// <summary>
+        /// Loads cached vectors from disk (a missing cache file is not an error);
+        /// entries set before loading take precedence over the file and stay pending for the next save
+        /// </summary>
+        /// <returns>OperationResult containing the number of loaded entries or error info</returns>
+        public async Task<OperationResult<int>> LoadAsync()
+        {
+            var hadUnsavedChanges = _hasUnsavedChanges;
+            try
+            {
+                var bytes = await File.ReadAllBytesAsync(_cacheFilePath);
+                using var reader = new BinaryReader(new MemoryStream(bytes), Encoding.UTF8);
+
+                var version = reader.ReadInt32();
+                if (version != FileFormatVersion)
+                {
+                    return OperationResult<int>.Success(0); // Stale format, rebuild on next save
+                }
+
+                var count = reader.ReadInt32();
+                for (int i = 0; i < count; i++)
+                {
+                    var key = reader.ReadString();
+                    var vector = new float[reader.ReadInt32()];
+                    var vectorBytes = MemoryMarshal.AsBytes(vector.AsSpan());
+                    if (reader.Read(vectorBytes) != vectorBytes.Length)
+                    {
+                        throw new EndOfStreamException("Embedding cache file is truncated");
+                    }
+                    _entries.TryAdd(key, vector);
+                }
+
+                // Only a cache that was clean before loading matches the file; earlier Set calls still need saving
+                if (!hadUnsavedChanges)
+                {
+                    _hasUnsavedChanges = false;
+                }
+                return OperationResult<int>.Success(count);
+            }
+            catch (Exception ex) when (ex is FileNotFoundException or DirectoryNotFoundException)
+            {
+                return OperationResult<int>.Success(0); // No cache yet
+            }
+            catch (Exception ex)
+            {
+                return OperationResult<int>.Failure(new ErrorInfo
+                {
+                    Category = ErrorCategory.FileAccess,
+                    Severity = ErrorSeverity.Low,
+                    UserMessage = "Không thể đọc cache embeddings.",
+                    TechnicalDetails = ex.Message,
+                    SuggestedAction = "Cache sẽ được tạo lại khi lưu; có thể xóa file cache nếu lỗi tiếp tục.",
+                    OriginalException = ex,
+                    ContextInfo = _cacheFilePath
+                });
+            }
+        }
+
+        /// <summary>
+        /// Writes all cached vectors to disk; the file is left untouched (mtime preserved) when nothing changed
+        /// </summary>
+        /// <returns>OperationResult containing true if the file was written, false if the cache was unchanged</returns>
+        public async Task<OperationResult<bool>> SaveAsync()
+        {
+            try
+            {
+                if (!_hasUnsavedChanges)
+                {
+                    return OperationResult<bool>.Success(false);
+                }
+
+                var directory = Path.GetDirectoryName(_cacheFilePath);
+                if (!string.IsNullOrEmpty(directory))
+                {
+                    Directory.CreateDirectory(directory);
+                }
+
+                using var buffer = new MemoryStream();
+                using (var writer = new BinaryWriter(buffer, Encoding.UTF8, leaveOpen: true))
+                {
+                    var snapshot = _entries.ToArray();
+                    writer.Write(FileFormatVersion);
+                    writer.Write(snapshot.Length);
+                    foreach (var (key, vector) in snapshot)
+                    {
+                        writer.Write(key);
+                        writer.Write(vector.Length);
+                        writer.Write(MemoryMarshal.AsBytes(vector.AsSpan()));
+                    }
+                }
+
+                await File.WriteAllBytesAsync(_cacheFilePath, buffer.ToArray());
+                _hasUnsavedChanges = false;
+                return OperationResult<bool>.Success(true);
+            }
+            catch (Exception ex)
+            {
+                return OperationResult<bool>.Failure(new ErrorInfo
+                {
+                    Category = ErrorCategory.FileAccess,
+                    Severity = ErrorSeverity.Low,
+                    UserMessage = "Không thể ghi cache embeddings.",
+                    TechnicalDetails = ex.Message,
+                    SuggestedAction = "Vui lòng kiểm tra quyền ghi tại thư mục chứa file cache.",
+                    OriginalException = ex,
+                    ContextInfo = _cacheFilePath
+                });
+            }
+        }
+    }
+}
@@ -1,6 +1,6 @@
 using Mscc.GenerativeAI;
 using Tcma.LanguageComparison.Core.Models;
-using System.Numerics;
+using System.Numerics.Tensors;
 
 namespace Tcma.LanguageComparison.Core.Services
 {
@@ -11,6 +11,7 @@ namespace Tcma.LanguageComparison.Core.Services
     {
         private readonly GoogleAI _googleAI;
         private readonly GenerativeModel _model;
+        private readonly EmbeddingCacheService? _embeddingCache;
         private readonly SemaphoreSlim _semaphore;
         private readonly int _maxEmbeddingBatchSize;
         private int _currentBatchSize;
@@ -18,13 +19,15 @@ namespace Tcma.LanguageComparison.Core.Services
         private double _averageResponseTime;
         private readonly object _batchSizeLock = new object();
         private const int MaxConcurrentRequests = 5; // Limit concurrent API calls
+        private static readonly string EmbeddingModelName = Model.TextEmbedding004;
 
         /// <summary>
         /// Initializes the Gemini embedding service
         /// </summary>
         /// <param name="apiKey">Google AI API key</param>
         /// <param name="maxEmbeddingBatchSize">Maximum batch size for embedding requests</param>
-        public GeminiEmbeddingService(string apiKey, int maxEmbeddingBatchSize = 50)
+        /// <param name="embeddingCache">Optional content-addressed cache; cached rows skip the API call</param>
+        public GeminiEmbeddingService(string apiKey, int maxEmbeddingBatchSize = 50, EmbeddingCacheService? embeddingCache = null)
         {
             if (string.IsNullOrWhiteSpace(apiKey))
             {
@@ -32,7 +35,8 @@ namespace Tcma.LanguageComparison.Core.Services
             }
 
             _googleAI = new GoogleAI(apiKey);
-            _model = _googleAI.GenerativeModel(Model.TextEmbedding004);
+            _model = _googleAI.GenerativeModel(EmbeddingModelName);
+            _embeddingCache = embeddingCache;
             _semaphore = new SemaphoreSlim(MaxConcurrentRequests, MaxConcurrentRequests);
             _maxEmbeddingBatchSize = maxEmbeddingBatchSize;
             _currentBatchSize = Math.Max(5, maxEmbeddingBatchSize / 4); // Start with 25% of max
@@ -98,6 +102,7 @@ namespace Tcma.LanguageComparison.Core.Services
 
         /// <summary>
         /// Generates embedding vector for a single text with retry logic
+        /// (the returned vector is L2-normalized)
         /// </summary>
         /// <param name="text">Text content to generate embedding for</param>
         /// <param name="maxRetries">Maximum number of retry attempts</param>
@@ -149,7 +154,11 @@ namespace Tcma.LanguageComparison.Core.Services
                         });
                     }
 
-                    return OperationResult<float[]>.Success(values.ToArray());
+                    // Normalize once at creation so every vector this service returns is a unit vector
+                    // and similarity downstream is a plain dot product
+                    var vector = values.ToArray();
+                    NormalizeVectorInPlace(vector);
+                    return OperationResult<float[]>.Success(vector);
                 }
                 catch (HttpRequestException ex)
                 {
@@ -263,17 +272,37 @@ namespace Tcma.LanguageComparison.Core.Services
                 });
             }
 
+            // Serve rows whose clean content was embedded before from the cache, only the misses go to the API
+            var pendingRows = validRows;
+            var cachedRows = 0;
+            if (_embeddingCache != null)
+            {
+                pendingRows = new List<ContentRow>(validRows.Count);
+                foreach (var row in validRows)
+                {
+                    if (_embeddingCache.TryGet(EmbeddingModelName, row.CleanContent, out var cachedVector))
+                    {
+                        row.EmbeddingVector = cachedVector;
+                        cachedRows++;
+                    }
+                    else
+                    {
+                        pendingRows.Add(row);
+                    }
+                }
+            }
+
             var total = validRows.Count;
-            var processed = 0;
-            var succeeded = 0;
+            var processed = cachedRows;
+            var succeeded = cachedRows;
             var failed = 0;
             var errors = new List<string>();
             var retryAttempts = 0;
 
-            progressCallback?.Report($"Bắt đầu tạo embeddings cho {total} nội dung...");
+            progressCallback?.Report($"Bắt đầu tạo embeddings cho {total} nội dung ({cachedRows} lấy từ cache)...");
 
             // Process in adaptive batches to optimize API performance
-            int remainingRows = validRows.Count;
+            int remainingRows = pendingRows.Count;
             int startIndex = 0;
             
             int initialBatchSize;
@@ -283,7 +312,7 @@ namespace Tcma.LanguageComparison.Core.Services
             }
             progressCallback?.Report($"Starting with adaptive batch size: {initialBatchSize} (max: {_maxEmbeddingBatchSize})");
 
-            while (startIndex < validRows.Count)
+            while (startIndex < pendingRows.Count)
             {
                 // Determine current batch size (may be smaller for last batch)
                 int currentBatchSize;
@@ -291,7 +320,7 @@ namespace Tcma.LanguageComparison.Core.Services
                 {
                     currentBatchSize = Math.Min(_currentBatchSize, remainingRows);
                 }
-                var batch = validRows.Skip(startIndex).Take(currentBatchSize).ToArray();
+                var batch = pendingRows.Skip(startIndex).Take(currentBatchSize).ToArray();
                 
                 var batchStartTime = DateTime.Now;
                 var batchErrors = 0;
@@ -304,6 +333,7 @@ namespace Tcma.LanguageComparison.Core.Services
                     if (result.IsSuccess)
                     {
                         row.EmbeddingVector = result.Data;
+                        _embeddingCache?.Set(EmbeddingModelName, row.CleanContent, result.Data!);
                         Interlocked.Increment(ref succeeded);
                     }
                     else
@@ -351,7 +381,8 @@ namespace Tcma.LanguageComparison.Core.Services
                 FailedRows = failed,
                 ErrorMessages = errors,
                 SuccessRate = total > 0 ? (double)succeeded / total * 100 : 0,
-                RetryAttempts = retryAttempts
+                RetryAttempts = retryAttempts,
+                CachedRows = cachedRows
             };
 
             progressCallback?.Report($"Hoàn thành! Đã tạo embeddings cho {succeeded}/{total} nội dung (Tỷ lệ thành công: {stats.SuccessRate:F1}%, Retries: {retryAttempts}).");
@@ -497,61 +528,36 @@ namespace Tcma.LanguageComparison.Core.Services
         }
 
         /// <summary>
-        /// Calculates cosine similarity between two embedding vectors
+        /// Calculates the dot product of two embedding vectors (equals cosine similarity for L2-normalized vectors)
         /// </summary>
         /// <param name="vector1">First embedding vector</param>
         /// <param name="vector2">Second embedding vector</param>
-        /// <returns>Cosine similarity value between -1 and 1</returns>
-        public static double CalculateCosineSimilarity(float[] vector1, float[] vector2)
+        /// <returns>Dot product of the two vectors</returns>
+        public static double CalculateDotProduct(float[] vector1, float[] vector2)
         {
             if (vector1.Length != vector2.Length)
             {
                 throw new ArgumentException("Vectors must have the same length");
             }
 
-            if (vector1.Length == 0)
-                return 0.0;
-
-            // Use vectorized operations for better performance
-            var span1 = vector1.AsSpan();
-            var span2 = vector2.AsSpan();
-            
-            double dotProduct = 0.0;
-            double magnitude1 = 0.0;
-            double magnitude2 = 0.0;
-
-            // Process in chunks that fit SIMD registers (Vector<float>.Count elements at a time)
-            int vectorSize = Vector<float>.Count;
-            int i = 0;
-            
-            // Vectorized processing for bulk of the data
-            for (; i <= vector1.Length - vectorSize; i += vectorSize)
-            {
-                var v1 = new Vector<float>(span1.Slice(i, vectorSize));
-                var v2 = new Vector<float>(span2.Slice(i, vectorSize));
-                
-                dotProduct += Vector.Dot(v1, v2);
-                magnitude1 += Vector.Dot(v1, v1);
-                magnitude2 += Vector.Dot(v2, v2);
-            }
-            
-            // Handle remaining elements
-            for (; i < vector1.Length; i++)
-            {
-                dotProduct += vector1[i] * vector2[i];
-                magnitude1 += vector1[i] * vector1[i];
-                magnitude2 += vector2[i] * vector2[i];
-            }
-
-            magnitude1 = Math.Sqrt(magnitude1);
-            magnitude2 = Math.Sqrt(magnitude2);
+            // TensorPrimitives dispatches to the widest SIMD kernel available (AVX-512/AVX2/NEON);
+            // spans are passed explicitly so the call binds to either the float or the generic overload
+            return TensorPrimitives.Dot((ReadOnlySpan<float>)vector1, (ReadOnlySpan<float>)vector2);
+        }
 
-            if (magnitude1 == 0.0 || magnitude2 == 0.0)
+        /// <summary>
+        /// L2-normalizes an embedding vector in place (zero vectors are left unchanged)
+        /// </summary>
+        /// <param name="vector">Embedding vector to normalize</param>
+        public static void NormalizeVectorInPlace(float[] vector)
+        {
+            var magnitude = TensorPrimitives.Norm((ReadOnlySpan<float>)vector);
+            if (magnitude == 0.0f)
             {
-                return 0.0;
+                return;
             }
 
-            return dotProduct / (magnitude1 * magnitude2);
+            TensorPrimitives.Multiply((ReadOnlySpan<float>)vector, 1.0f / magnitude, vector.AsSpan());
         }
 
         /// <summary>
@@ -574,5 +580,6 @@ namespace Tcma.LanguageComparison.Core.Services
         public List<string> ErrorMessages { get; init; } = new();
         public double SuccessRate { get; init; }
         public int RetryAttempts { get; init; }
+        public int CachedRows { get; init; }
     }
 } 
\ No newline at end of file
@@ -32,6 +32,9 @@ public class SettingsService : ISettingsService
         "settings.json"
     );
 
+    // Static so the indented-JSON options (and their cached type metadata) are shared by every SaveSettingsAsync call
+    private static readonly JsonSerializerOptions SerializerOptions = new() { WriteIndented = true };
+
     private UserSettings _settings = new();
 
     public double SimilarityThreshold => _settings.SimilarityThreshold;
@@ -78,12 +81,22 @@ public class SettingsService : ISettingsService
                 Directory.CreateDirectory(directory);
             }
 
-            // Save to file
-            var json = JsonSerializer.Serialize(_settings, new JsonSerializerOptions 
-            { 
-                WriteIndented = true 
-            });
-            await File.WriteAllTextAsync(SettingsFilePath, json);
+            // Save to a temp file first (UTF-8 straight into the stream), then replace settings.json,
+            // so an exception during serialization leaves the existing settings intact
+            var tempFilePath = SettingsFilePath + ".tmp";
+            try
+            {
+                await using (var stream = File.Create(tempFilePath))
+                {
+                    await JsonSerializer.SerializeAsync(stream, _settings, SerializerOptions);
+                }
+                File.Move(tempFilePath, SettingsFilePath, overwrite: true);
+            }
+            catch
+            {
+                File.Delete(tempFilePath);
+                throw;
+            }
 
             // Notify subscribers
             SettingsChanged?.Invoke(this, _settings);